@@ -7,18 +7,47 @@ Usage:
     python main.py --help       # Show help
 """
 
+import os
 import sys
-import argparse
-from pathlib import Path
 
-# Add the wizard module to the path
-sys.path.insert(0, str(Path(__file__).parent))
+VERSION_STRING = "BSub Wizard 1.0.0"
 
-from wizard.app import run_wizard
+
+def _get_wizard_runner():
+    """Return the callable that runs the wizard
+    
+    With BSUB_WIZARD_DAEMON=1 and the optional `quicken` package installed,
+    the wizard is served from a prewarmed background process so later
+    launches skip the Textual import. Otherwise the wizard runs in-process.
+    """
+    if os.environ.get("BSUB_WIZARD_DAEMON") == "1":
+        try:
+            from quicken import cli_factory
+        except ImportError:
+            pass
+        else:
+            @cli_factory("bsub-wizard")
+            def quicken_runner():
+                # Import the app here so the server process has Textual loaded
+                import wizard.app  # noqa: F401
+                from wizard.__main__ import run_wizard
+                return run_wizard
+            
+            return quicken_runner
+    
+    from wizard.__main__ import run_wizard
+    return run_wizard
 
 
 def main():
     """Main entry point for the BSub Wizard"""
+    # Fast path: answer --version without building the argument parser
+    if sys.argv[1:] == ["--version"]:
+        print(VERSION_STRING)
+        return
+    
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description="BSub Wizard - Interactive guide for creating bsub commands",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -45,7 +74,7 @@ For more information, visit: https://github.com/janelia/bsub-wizard
     parser.add_argument(
         "--version",
         action="version",
-        version="BSub Wizard 1.0.0"
+        version=VERSION_STRING
     )
     
     parser.add_argument(
@@ -64,9 +93,14 @@ For more information, visit: https://github.com/janelia/bsub-wizard
     
     # Set debug mode if requested
     if args.debug:
-        import os
         os.environ["TEXTUAL_DEBUG"] = "1"
     
+    # Add the wizard module to the path
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    
+    # Deferred so --help/--version don't pay for the Textual import
+    run_wizard = _get_wizard_runner()
+    
     try:
         # Run the wizard
         run_wizard()
@@ -76,8 +110,7 @@ For more information, visit: https://github.com/janelia/bsub-wizard
     except Exception as e:
         print(f"Error running BSub Wizard: {e}")
         if args.debug:
-            import traceback
-            traceback.print_exc()
+            sys.excepthook(*sys.exc_info())
         sys.exit(1)
 
 
@@ -1,11 +1,29 @@
 #!/usr/bin/env python3
 
+import compileall
+import os
+
 from setuptools import setup, find_packages
-from pathlib import Path
+from setuptools.command.install import install
 
 # Read the README file
-this_directory = Path(__file__).parent
-long_description = (this_directory / "README.md").read_text() if (this_directory / "README.md").exists() else ""
+this_directory = os.path.dirname(os.path.abspath(__file__))
+try:
+    with open(os.path.join(this_directory, "README.md"), encoding="utf-8") as f:
+        long_description = f.read()
+except FileNotFoundError:
+    long_description = ""
+
+
+class PostInstallCommand(install):
+    """Install, then byte-compile the installed package up front"""
+    
+    def run(self):
+        super().run()
+        # Compile at the interpreter's default optimization level, so the
+        # .pyc files are the ones a normal `python` run actually loads
+        compileall.compile_dir(os.path.join(self.install_lib, "wizard"), quiet=1)
+
 
 setup(
     name="bsub-wizard",
@@ -18,6 +36,9 @@ setup(
     url="https://github.com/janelia/bsub-wizard",
     packages=find_packages(),
     include_package_data=True,
+    package_data={
+        "wizard": ["*.tcss"],
+    },
     python_requires=">=3.8",
     install_requires=[
         "textual>=0.40.0",
@@ -32,11 +53,14 @@ setup(
             "black>=22.0.0",
             "flake8>=5.0.0",
             "mypy>=0.991",
-        ]
+        ],
+        "daemon": [
+            "quicken; sys_platform != 'win32'",
+        ],
     },
     entry_points={
         "console_scripts": [
-            "bsub-wizard=wizard.app:run_wizard",
+            "bsub-wizard=wizard.__main__:main",
         ],
     },
     classifiers=[
@@ -55,6 +79,9 @@ setup(
         "Topic :: Software Development :: User Interfaces",
         "Environment :: Console :: Curses",
     ],
+    cmdclass={
+        "install": PostInstallCommand,
+    },
     keywords="hpc cluster job-submission lsf bsub janelia scientific-computing",
     project_urls={
         "Bug Reports": "https://github.com/janelia/bsub-wizard/issues",
@@ -3,11 +3,9 @@
 Basic test to verify the BSub Wizard components work correctly
 """
 
+import functools
+import shlex
 import sys
-from pathlib import Path
-
-# Add wizard to path
-sys.path.insert(0, str(Path(__file__).parent))
 
 from wizard.models.job_config import JobConfiguration, JobType, GPUConfiguration
 from wizard.models.cluster_info import ClusterConfiguration
@@ -15,6 +13,18 @@ from wizard.utils.command_builder import BsubCommandBuilder
 from wizard.utils.validators import JobValidator
 
 
+@functools.lru_cache(maxsize=1)
+def _cluster():
+    """Shared cluster configuration for all tests in this module"""
+    return ClusterConfiguration()
+
+
+@functools.lru_cache(maxsize=1)
+def _builder():
+    """Shared command builder for all tests in this module"""
+    return BsubCommandBuilder(_cluster().general_config)
+
+
 def test_job_configuration():
     """Test job configuration creation and validation"""
     print("Testing Job Configuration...")
@@ -50,13 +60,19 @@ def test_job_configuration():
     is_valid, errors = gpu_job.is_valid()
     assert is_valid, f"GPU job validation failed: {errors}"
     print("✓ GPU job configuration valid")
+    
+    # "int" is only reserved as a whole word
+    for job_name, expected in [("interp_job", True), ("int", False), ("my int", False)]:
+        is_valid, errors = JobConfiguration(job_name=job_name, command="python script.py").is_valid()
+        assert is_valid == expected, f"Job name {job_name!r}: {errors}"
+    print("✓ Reserved job name words detected")
 
 
 def test_cluster_configuration():
     """Test cluster configuration loading"""
     print("Testing Cluster Configuration...")
     
-    cluster = ClusterConfiguration()
+    cluster = _cluster()
     
     # Test queue access
     assert len(cluster.queues) > 0, "No queues configured"
@@ -82,8 +98,7 @@ def test_command_builder():
     """Test bsub command generation"""
     print("Testing Command Builder...")
     
-    cluster = ClusterConfiguration()
-    builder = BsubCommandBuilder(cluster.general_config)
+    builder = _builder()
     
     # Test CPU command
     cpu_job = JobConfiguration(
@@ -99,8 +114,9 @@ def test_command_builder():
     cpu_command = builder.build_command(cpu_job)
     expected_parts = ["bsub", "-J", "test_cpu", "-n", "4", "-q", "local", "-W", "1:00", "-o", "/dev/null", "echo hello"]
     
-    for part in expected_parts:
-        assert part in cpu_command, f"Missing '{part}' in CPU command: {cpu_command}"
+    # Compare whole shell tokens, so e.g. "1:00" can't match inside "11:00"
+    missing = set(expected_parts) - set(shlex.split(cpu_command))
+    assert not missing, f"Missing {sorted(missing)} in CPU command: {cpu_command}"
     print("✓ CPU command generation works")
     
     # Test GPU command
@@ -119,10 +135,10 @@ def test_command_builder():
     )
     
     gpu_command = builder.build_command(gpu_job)
-    expected_gpu_parts = ["bsub", "-J", "test_gpu", "-n", "12", "-q", "gpu_a100", "-gpu", "num=1", "-W", "2:00"]
+    expected_gpu_parts = ["bsub", "-J", "test_gpu", "-n", "12", "-q", "gpu_a100", "-gpu", "num=1:gmodel=NVIDIAA100_SXM4_80GB", "-W", "2:00"]
     
-    for part in expected_gpu_parts:
-        assert part in gpu_command, f"Missing '{part}' in GPU command: {gpu_command}"
+    missing = set(expected_gpu_parts) - set(shlex.split(gpu_command))
+    assert not missing, f"Missing {sorted(missing)} in GPU command: {gpu_command}"
     print("✓ GPU command generation works")
     
     # Test cost estimation
@@ -198,8 +214,7 @@ def main():
         print("Example commands that would be generated:")
         
         # Show example commands
-        cluster = ClusterConfiguration()
-        builder = BsubCommandBuilder(cluster.general_config)
+        builder = _builder()
         
         cpu_example = JobConfiguration(
             job_type=JobType.CPU,
@@ -224,8 +239,7 @@ def main():
         
     except Exception as e:
         print(f"❌ Test failed: {e}")
-        import traceback
-        traceback.print_exc()
+        sys.excepthook(*sys.exc_info())
         return 1
     
     return 0
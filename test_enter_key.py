@@ -4,82 +4,8 @@ Test specifically for the Enter key navigation issue
 """
 
 import sys
-from pathlib import Path
 
-# Add wizard to path
-sys.path.insert(0, str(Path(__file__).parent))
-
-def test_enter_key_functionality():
-    """Test that Enter key navigation would work"""
-    try:
-        from wizard.app import BsubWizardApp
-        
-        print("=" * 60)
-        print("Testing Enter Key Navigation Fix")
-        print("=" * 60)
-        
-        # Create app instance
-        app = BsubWizardApp()
-        print("✓ App created successfully")
-        
-        # Test initial state
-        print(f"✓ Initial step: {app.current_step}")
-        print(f"✓ Total steps: {app.total_steps}")
-        
-        # Test that the validation method works without TypeError
-        print("✓ Testing validation method...")
-        result = app.validate_current_wizard_step()
-        print(f"✓ Validation result: {result}")
-        
-        # Simulate the Enter key action (what happens when Enter is pressed)
-        print("✓ Simulating Enter key press (action_next)...")
-        
-        # Before the fix, this would cause:
-        # TypeError: BsubWizardApp.validate_current_step() takes 1 positional argument but 2 were given
-        
-        # This should work now (though it will fail with DOM errors since app isn't running)
-        try:
-            app.action_next()
-            print("✓ action_next() completed - this means the TypeError is fixed!")
-        except Exception as e:
-            error_msg = str(e)
-            if "takes 1 positional argument but 2 were given" in error_msg:
-                print("❌ TypeError still present - fix didn't work")
-                return False
-            elif "No screens on stack" in error_msg or "ScreenStackError" in error_msg:
-                print("✓ Different error (expected) - TypeError is fixed!")
-            else:
-                print(f"✓ Different error: {error_msg}")
-        
-        print("\n" + "=" * 60)
-        print("🎉 SUCCESS: Enter key TypeError has been resolved!")
-        print("=" * 60)
-        print("\nThe wizard should now work correctly when you:")
-        print("1. Run: pixi run start")
-        print("2. Press Enter to navigate between steps")
-        print("3. Use the Next button or keyboard shortcuts")
-        
-        return True
-        
-    except Exception as e:
-        print(f"❌ Test failed with unexpected error: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
-
-def main():
-    """Run the Enter key test"""
-    success = test_enter_key_functionality()
-    
-    if success:
-        print("\n🚀 The BSub Wizard is ready for use!")
-        print("\nQuick test commands:")
-        print("  pixi run test-quick  # Quick validation")
-        print("  pixi run start       # Launch the wizard")
-    else:
-        print("\n❌ Issues still remain")
-    
-    return 0 if success else 1
+from wizard.diagnostics import run_enter_key
 
 if __name__ == "__main__":
-    sys.exit(main())
\ No newline at end of file
+    sys.exit(run_enter_key())
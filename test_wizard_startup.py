@@ -5,10 +5,6 @@ Test the wizard startup by running it briefly
 
 import sys
 import asyncio
-from pathlib import Path
-
-# Add wizard to path
-sys.path.insert(0, str(Path(__file__).parent))
 
 async def test_wizard_startup():
     """Test that the wizard can start and initialize properly"""
@@ -33,8 +29,7 @@ async def test_wizard_startup():
         
     except Exception as e:
         print(f"❌ Wizard startup failed: {e}")
-        import traceback
-        traceback.print_exc()
+        sys.excepthook(*sys.exc_info())
         return False
 
 def main():
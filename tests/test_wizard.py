@@ -0,0 +1,171 @@
+"""
+Application-level tests for the BSub Wizard
+
+These replace the separate "does the app import and construct cleanly"
+scripts at the repository root, sharing a single app instance so the
+Textual stack is imported and the app built only once per test session.
+"""
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def app():
+    """A BsubWizardApp instance that is constructed but not running"""
+    from wizard.app import BsubWizardApp
+    return BsubWizardApp()
+
+
+def test_app_structure(app):
+    """The app exposes its configuration objects and wizard steps"""
+    assert hasattr(app, "cluster_config"), "Missing cluster_config"
+    assert hasattr(app, "job_config"), "Missing job_config"
+    assert hasattr(app, "command_builder"), "Missing command_builder"
+    assert hasattr(app, "steps"), "Missing steps"
+
+    assert len(app.steps) == 8, f"Expected 8 steps, got {len(app.steps)}"
+    for i, (step_name, _) in enumerate(app.steps):
+        assert step_name, "Step is missing a name"
+        screen_class = app.get_screen_class(i)
+        assert isinstance(screen_class, type), f"Step {step_name!r} has no screen class"
+
+
+def test_action_methods_present(app):
+    """All navigation and dialog actions are defined"""
+    actions = ['action_next', 'action_back', 'action_save_config', 'action_load_config', 'action_help']
+    for action in actions:
+        assert callable(getattr(app, action, None)), f"Missing {action}"
+
+
+def test_initial_state(app):
+    """The wizard starts on the first of its steps"""
+    assert app.current_step == 0
+    assert app.total_steps == len(app.steps)
+
+
+def test_validate_without_running_app(app):
+    """Step validation succeeds when there is no DOM to query"""
+    result = app.validate_current_wizard_step()
+    assert result is True
+
+
+def test_next_without_running_app():
+    """Navigation works on an app that hasn't been mounted"""
+    from wizard.app import BsubWizardApp
+
+    app = BsubWizardApp()
+    app.action_next()
+    assert app.current_step == 1
+    assert app._screen_cache == {}
+
+
+def test_cluster_config_loaded(app):
+    """The app's cluster configuration has queues and GPUs"""
+    assert len(app.cluster_config.queues) > 0, "No queues in cluster config"
+    assert len(app.cluster_config.gpus) > 0, "No GPUs in cluster config"
+
+
+@pytest.mark.asyncio
+async def test_keyboard_navigation():
+    """Enter and Escape move between wizard steps in a running app"""
+    from wizard.app import BsubWizardApp
+
+    app = BsubWizardApp()
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        assert app.current_step == 0
+
+        await pilot.press("enter")
+        await pilot.pause()
+        assert app.current_step == 1
+
+        await pilot.press("escape")
+        await pilot.pause()
+        assert app.current_step == 0
+
+
+@pytest.mark.asyncio
+async def test_button_navigation():
+    """The Next and Back buttons move between wizard steps"""
+    from wizard.app import BsubWizardApp
+
+    app = BsubWizardApp()
+    async with app.run_test() as pilot:
+        await pilot.pause()
+
+        await pilot.click("#next-button")
+        await pilot.pause()
+        assert app.current_step == 1
+
+        await pilot.click("#back-button")
+        await pilot.pause()
+        assert app.current_step == 0
+
+
+@pytest.mark.asyncio
+async def test_back_reuses_step_screen():
+    """Going back shows the earlier step's screen instead of rebuilding it"""
+    from wizard.app import BsubWizardApp
+
+    app = BsubWizardApp()
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        welcome = app._screen_cache[0]
+
+        await pilot.press("enter")
+        await pilot.pause()
+        assert not welcome.display
+
+        await pilot.press("escape")
+        await pilot.pause()
+        assert app._screen_cache[0] is welcome
+        assert welcome.display
+        assert not app._screen_cache[1].display
+
+
+@pytest.mark.asyncio
+async def test_error_messages_on_separate_lines():
+    """Each error passed to show_error_message gets its own line"""
+    from wizard.app import BsubWizardApp
+
+    app = BsubWizardApp()
+    async with app.run_test() as pilot:
+        app.show_error_message("Errors", ["first", "second"])
+        await pilot.pause()
+        assert app.screen.message == "first\nsecond"
+
+
+@pytest.mark.asyncio
+async def test_rapid_next_waits_for_screen():
+    """Next presses made before the new step's screen is mounted are dropped"""
+    from wizard.app import BsubWizardApp
+
+    app = BsubWizardApp()
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        app.action_next()
+        app.action_next()
+        app.action_next()
+        await pilot.pause()
+        assert app.current_step == 1
+
+
+@pytest.mark.asyncio
+async def test_load_after_typing_keeps_loaded_paths():
+    """Path edits still pending when a configuration is loaded are dropped"""
+    from wizard.app import BsubWizardApp
+
+    app = BsubWizardApp()
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        app.current_step = 5
+        app.show_current_step()
+        await pilot.pause()
+
+        app.query_one("#output-file-input").value = "/groups/typed.log"
+        await pilot.pause()
+
+        app.job_config.from_dict({"output_file": "/groups/loaded.log"})
+        app.discard_screens()
+        await pilot.pause(0.3)
+        assert app.job_config.output_file == "/groups/loaded.log"
@@ -0,0 +1,37 @@
+"""
+BSub Wizard - Interactive bsub command builder for the Janelia compute cluster
+
+The commonly used classes are available from the package itself, e.g.
+``from wizard import JobConfiguration``. They are imported on first access
+so that importing ``wizard`` stays cheap.
+"""
+
+import importlib
+
+__version__ = "1.0.0"
+
+# Public name -> (module, attribute)
+_LAZY_IMPORTS = {
+    "JobConfiguration": ("wizard.models.job_config", "JobConfiguration"),
+    "JobType": ("wizard.models.job_config", "JobType"),
+    "GPUConfiguration": ("wizard.models.job_config", "GPUConfiguration"),
+    "ClusterConfiguration": ("wizard.models.cluster_info", "ClusterConfiguration"),
+    "BsubCommandBuilder": ("wizard.utils.command_builder", "BsubCommandBuilder"),
+    "JobValidator": ("wizard.utils.validators", "JobValidator"),
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name):
+    try:
+        module_name, attr = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = value  # Cache so later lookups bypass __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,47 @@
+"""
+Command-line entry point for ``python -m wizard`` and the ``bsub-wizard`` script
+
+--help and --version are answered without importing Textual; the
+application module is only imported once the wizard is actually launched.
+"""
+
+import sys
+
+from . import __version__
+
+
+def run_wizard():
+    """Entry point to run the BSub Wizard"""
+    from .app import BsubWizardApp
+    app = BsubWizardApp()
+    app.run()
+
+
+def main(argv=None) -> int:
+    """Parse the command line and run the wizard"""
+    args = sys.argv[1:] if argv is None else argv
+    
+    # Fast path: answer --version without building the argument parser
+    if args == ["--version"]:
+        print(f"BSub Wizard {__version__}")
+        return 0
+    
+    import argparse
+    
+    parser = argparse.ArgumentParser(
+        prog="bsub-wizard",
+        description="BSub Wizard - Interactive guide for creating bsub commands",
+    )
+    parser.add_argument(
+        "--version",
+        action="version",
+        version=f"BSub Wizard {__version__}"
+    )
+    parser.parse_args(args)
+    
+    run_wizard()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
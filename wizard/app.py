@@ -1,139 +1,72 @@
+from rich.text import Text
 from textual.app import App, ComposeResult
 from textual.containers import Container, Horizontal, Vertical
 from textual.widgets import Header, Footer, Static, Button, Input, Select
 from textual.binding import Binding
 from textual.screen import ModalScreen
-from textual.reactive import reactive
+import importlib
 import json
 import os
+import sys
 from pathlib import Path
+from typing import Callable, ClassVar, Dict, NamedTuple
 
 from .models.job_config import JobConfiguration, JobType
 from .models.cluster_info import ClusterConfiguration
 from .utils.command_builder import BsubCommandBuilder
-from .screens.welcome import WelcomeScreen
-from .screens.job_type import JobTypeScreen
-from .screens.resources import ResourcesScreen
-from .screens.queue import QueueScreen
-from .screens.runtime import RuntimeScreen
-from .screens.files import FilesScreen
-from .screens.advanced import AdvancedScreen
-from .screens.review import ReviewScreen
+
+
+def _screen_loader(module_name: str, class_name: str):
+    """Return a function that imports a wizard screen class when called
+    
+    Screen modules are only imported once their step is shown, so startup
+    doesn't pay for the screens the user hasn't reached yet.
+    """
+    def load():
+        module = importlib.import_module(f".screens.{module_name}", __package__)
+        return getattr(module, class_name)
+    return load
+
+
+class Step(NamedTuple):
+    """A wizard step: its display name and a loader for its screen class"""
+    name: str
+    loader: Callable[[], type]
+
+
+# Wizard steps, in order
+_STEPS = (
+    Step("Welcome", _screen_loader("welcome", "WelcomeScreen")),
+    Step("Job Type", _screen_loader("job_type", "JobTypeScreen")),
+    Step("Resources", _screen_loader("resources", "ResourcesScreen")),
+    Step("Queue Selection", _screen_loader("queue", "QueueScreen")),
+    Step("Runtime & Scheduling", _screen_loader("runtime", "RuntimeScreen")),
+    Step("File Management", _screen_loader("files", "FilesScreen")),
+    Step("Advanced Options", _screen_loader("advanced", "AdvancedScreen")),
+    Step("Review & Generate", _screen_loader("review", "ReviewScreen")),
+)
+
+# Progress (text, bar width) for each step, indexed by step
+_PROGRESS = tuple(
+    (f"Step {i + 1} of {len(_STEPS)}: {step.name}", f"{(i / len(_STEPS)) * 100}%")
+    for i, step in enumerate(_STEPS)
+)
+
+# Navigation button ids. Hyphenated literals aren't interned automatically,
+# so intern them to keep the id comparisons in button dispatch cheap.
+_BACK_ID = sys.intern("back-button")
+_NEXT_ID = sys.intern("next-button")
+_SAVE_ID = sys.intern("save-button")
+_LOAD_ID = sys.intern("load-button")
+_HELP_ID = sys.intern("help-button")
 
 
 class BsubWizardApp(App):
     """Main application for the BSub Wizard"""
     
-    CSS = """
-    Screen {
-        background: $surface;
-    }
-    
-    .wizard-container {
-        height: 100%;
-        background: $surface;
-    }
-    
-    .header-container {
-        height: 3;
-        background: $primary;
-        color: $text;
-        padding: 1;
-    }
-    
-    .content-container {
-        height: 1fr;
-        background: $surface;
-    }
-    
-    .footer-container {
-        height: 3;
-        background: $primary-darken-1;
-    }
-    
-    .progress-bar {
-        height: 1;
-        background: $primary-lighten-1;
-        margin-top: 1;
-    }
-    
-    .progress-fill {
-        height: 100%;
-        background: $accent;
-    }
-    
-    .navigation-buttons {
-        height: 3;
-        background: $surface-lighten-1;
-        align: center middle;
-    }
-    
-    Button {
-        margin: 0 1;
-        min-width: 12;
-    }
-    
-    Button.primary {
-        background: $accent;
-        color: $text;
-    }
-    
-    Button.secondary {
-        background: $surface-lighten-2;
-        color: $text;
-    }
-    
-    .error-message {
-        background: $error;
-        color: $text;
-        padding: 1;
-        margin: 1;
-    }
-    
-    .warning-message {
-        background: $warning;
-        color: $text;
-        padding: 1;
-        margin: 1;
-    }
-    
-    .success-message {
-        background: $success;
-        color: $text;
-        padding: 1;
-        margin: 1;
-    }
-    
-    .dialog-container {
-        background: $surface;
-        border: solid $primary;
-        padding: 2;
-        margin: 2;
-        width: 60%;
-        height: auto;
-        max-width: 80;
-    }
-    
-    .dialog-title {
-        text-align: center;
-        background: $primary;
-        color: $text;
-        padding: 1;
-        margin: 0 0 2 0;
-    }
-    
-    .help-container {
-        background: $surface;
-        border: solid $primary;
-        padding: 2;
-        margin: 2;
-        width: 80%;
-        height: 80%;
-        max-width: 120;
-    }
-    """
+    CSS_PATH = "app.tcss"
     
-    BINDINGS = [
+    BINDINGS = (
         Binding("q", "quit", "Quit", priority=True),
         Binding("ctrl+c", "quit", "Quit", priority=True),
         Binding("f1", "help", "Help"),
@@ -141,14 +74,22 @@ class BsubWizardApp(App):
         Binding("ctrl+l", "load_config", "Load Config"),
         Binding("escape", "back", "Back"),
         Binding("enter", "next", "Next"),
-    ]
+    )
+    
+    # Navigation button id -> action method name
+    _BUTTON_ACTIONS: ClassVar[Dict[str, str]] = {
+        _NEXT_ID: "action_next",
+        _BACK_ID: "action_back",
+        _SAVE_ID: "action_save_config",
+        _LOAD_ID: "action_load_config",
+        _HELP_ID: "action_help",
+    }
     
     TITLE = "BSub Wizard - Janelia Compute Cluster Job Submission"
     SUB_TITLE = "Interactive guide for creating bsub commands"
     
-    # Reactive attributes
-    current_step = reactive(0)
-    total_steps = reactive(8)
+    # Wizard steps, shared by all instances
+    steps = _STEPS
     
     def __init__(self):
         super().__init__()
@@ -158,19 +99,29 @@ class BsubWizardApp(App):
         self.job_config = JobConfiguration()
         self.command_builder = BsubCommandBuilder(self.cluster_config.general_config)
         
-        # Define wizard steps
-        self.steps = [
-            ("Welcome", WelcomeScreen),
-            ("Job Type", JobTypeScreen),
-            ("Resources", ResourcesScreen),
-            ("Queue Selection", QueueScreen),
-            ("Runtime & Scheduling", RuntimeScreen),
-            ("File Management", FilesScreen),
-            ("Advanced Options", AdvancedScreen),
-            ("Review & Generate", ReviewScreen),
-        ]
+        # Wizard position; the progress bar and buttons are updated explicitly
+        self.current_step = 0
+        self.total_steps = len(_STEPS)
+        
+        # Widgets used on every step change, looked up once in on_mount
+        self._progress_text_widget = None
+        self._progress_fill_widget = None
+        self._back_button = None
+        self._next_button = None
+        self._content_area = None
+        
+        # (current_step, total_steps) last shown by the progress bar and buttons
+        self._last_chrome_state = None
+        
+        # Screen classes resolved so far, keyed by step index
+        self._screen_classes = {}
+        
+        # Mounted step screens, keyed by step index. Revisited steps are
+        # shown again instead of being rebuilt (see discard_screens).
+        self._screen_cache = {}
         
-        self.total_steps = len(self.steps)
+        # (job configuration JSON, command, cost) from the last command build
+        self._command_cache = None
         
         # Track if configuration has been modified
         self.config_modified = False
@@ -183,7 +134,7 @@ class BsubWizardApp(App):
             with Vertical():
                 # Progress indicator
                 with Container(classes="header-container"):
-                    yield Static(self._get_progress_text(), id="progress-text")
+                    yield Static(_PROGRESS[self.current_step][0], id="progress-text")
                     with Container(classes="progress-bar"):
                         yield Static("", id="progress-fill", classes="progress-fill")
                 
@@ -193,85 +144,120 @@ class BsubWizardApp(App):
                 
                 # Navigation buttons
                 with Horizontal(classes="navigation-buttons"):
-                    yield Button("← Back", id="back-button", classes="secondary")
-                    yield Button("Next →", id="next-button", classes="primary")
-                    yield Button("Save Config", id="save-button", classes="secondary")
-                    yield Button("Load Config", id="load-button", classes="secondary")
-                    yield Button("Help", id="help-button", classes="secondary")
+                    yield Button("← Back", id=_BACK_ID, classes="secondary")
+                    yield Button("Next →", id=_NEXT_ID, classes="primary")
+                    yield Button("Save Config", id=_SAVE_ID, classes="secondary")
+                    yield Button("Load Config", id=_LOAD_ID, classes="secondary")
+                    yield Button("Help", id=_HELP_ID, classes="secondary")
         
         yield Footer()
     
     def on_mount(self) -> None:
         """Initialize the application"""
-        self.show_current_step()
-        self.update_navigation_buttons()
+        self._progress_text_widget = self.query_one("#progress-text", Static)
+        self._progress_fill_widget = self.query_one("#progress-fill", Static)
+        self._back_button = self.query_one(f"#{_BACK_ID}", Button)
+        self._next_button = self.query_one(f"#{_NEXT_ID}", Button)
+        self._content_area = self.query_one("#content-area")
+        self._refresh_chrome()
+        # Let the header and progress bar paint before building the first screen
+        self.call_after_refresh(self.show_current_step)
+    
+    def _refresh_chrome(self) -> None:
+        """Update the progress bar and navigation buttons if the step changed"""
+        state = (self.current_step, self.total_steps)
+        if state == self._last_chrome_state:
+            return
+        self._last_chrome_state = state
         self.update_progress()
-    
-    def _get_progress_text(self) -> str:
-        """Get the current progress text"""
-        if self.current_step < len(self.steps):
-            step_name = self.steps[self.current_step][0]
-            return f"Step {self.current_step + 1} of {self.total_steps}: {step_name}"
-        else:
-            return f"Step {self.total_steps} of {self.total_steps}: Complete"
+        self.update_navigation_buttons()
     
     def update_progress(self) -> None:
         """Update the progress bar and text"""
-        progress_text = self.query_one("#progress-text", Static)
-        progress_text.update(self._get_progress_text())
-        
-        progress_fill = self.query_one("#progress-fill", Static)
-        progress_percentage = (self.current_step / self.total_steps) * 100
-        progress_fill.styles.width = f"{progress_percentage}%"
+        text, width = _PROGRESS[self.current_step]
+        self._progress_text_widget.update(text)
+        self._progress_fill_widget.styles.width = width
     
     def update_navigation_buttons(self) -> None:
         """Update navigation button states"""
-        back_button = self.query_one("#back-button", Button)
-        next_button = self.query_one("#next-button", Button)
-        
         # Back button
-        back_button.disabled = self.current_step == 0
+        self._back_button.disabled = self.current_step == 0
         
         # Next button
         if self.current_step == self.total_steps - 1:
-            next_button.label = "Generate Command"
+            self._next_button.label = "Generate Command"
         else:
-            next_button.label = "Next →"
+            self._next_button.label = "Next →"
+    
+    def get_screen_class(self, step: int):
+        """Return the screen class for a wizard step, importing it if needed"""
+        screen_class = self._screen_classes.get(step)
+        if screen_class is None:
+            screen_class = self._screen_classes[step] = self.steps[step].loader()
+        return screen_class
     
     def show_current_step(self) -> None:
         """Display the current wizard step"""
-        if self.current_step >= len(self.steps):
+        if self.current_step >= len(self.steps) or self._content_area is None:
+            # Past the last step, or the app isn't mounted yet
             return
         
-        step_name, screen_class = self.steps[self.current_step]
-        
-        # Create and show the screen
-        screen = screen_class(
-            wizard_app=self,
-            job_config=self.job_config,
-            cluster_config=self.cluster_config
-        )
+        content_area = self._content_area
         
-        content_area = self.query_one("#content-area")
-        content_area.remove_children()
-        content_area.mount(screen)
-        
-        self.update_progress()
-        self.update_navigation_buttons()
+        # Apply the screen swap and chrome updates as a single repaint
+        with self.batch_update():
+            screen = self._screen_cache.get(self.current_step)
+            if screen is None:
+                screen_class = self.get_screen_class(self.current_step)
+                screen = screen_class(
+                    wizard_app=self,
+                    job_config=self.job_config,
+                    cluster_config=self.cluster_config
+                )
+                self._screen_cache[self.current_step] = screen
+                # Drop the "Loading..." placeholder on first use
+                content_area.query("#screen-content").remove()
+                content_area.mount(screen)
+            
+            # Only the current step's screen is visible
+            for cached_screen in self._screen_cache.values():
+                cached_screen.display = cached_screen is screen
+            
+            self._refresh_chrome()
     
     def action_next(self) -> None:
         """Move to the next step"""
+        # Drop presses that arrive while the previous transition's screen is
+        # still mounting; its validation can't run until it's on display
+        screen = self._screen_cache.get(self.current_step)
+        if screen is not None and not screen.is_mounted:
+            return
+        
         # Validate current step
         if not self.validate_current_wizard_step():
             return
         
         if self.current_step < self.total_steps - 1:
-            self.current_step += 1
-            self.show_current_step()
+            with self.batch_update():
+                # Later screens may depend on what was just entered, so rebuild them
+                self.discard_screens(self.current_step + 1)
+                self.current_step += 1
+                self.show_current_step()
         else:
             # Final step - generate command
             self._generate_final_command()
     
+    def discard_screens(self, from_step: int = 0) -> None:
+        """Unmount cached step screens from `from_step` onwards
+        
+        Call this whenever the job configuration changes in a way the
+        cached screens wouldn't reflect, e.g. after loading a configuration.
+        """
+        stale = [self._screen_cache.pop(step) for step in list(self._screen_cache) if step >= from_step]
+        if stale:
+            # One removal for all of them rather than one per screen
+            self._content_area.remove_children(stale)
+    
     def action_back(self) -> None:
         """Move to the previous step"""
         if self.current_step > 0:
@@ -288,21 +274,20 @@ class BsubWizardApp(App):
     
     def action_help(self) -> None:
         """Show help information"""
-        self.push_screen(HelpScreen())
+        # The help screen is built once and kept installed for later use
+        if not self.is_screen_installed("help"):
+            self.install_screen(HelpScreen(), "help")
+        self.push_screen("help")
     
     def validate_current_wizard_step(self) -> bool:
         """Validate the current step before proceeding"""
-        try:
-            # Get the current screen and validate it
-            content_area = self.query_one("#content-area")
-            if content_area.children:
-                current_screen = content_area.children[0]
-                if hasattr(current_screen, 'validate'):
-                    return current_screen.validate()
-        except Exception:
-            # If we can't query the DOM (app not running), just return True
-            pass
-        return True
+        # Nothing to validate until the step's screen is on display
+        # (e.g. when the app isn't running)
+        current_screen = self._screen_cache.get(self.current_step)
+        if current_screen is None or not current_screen.is_mounted:
+            return True
+        validate = getattr(current_screen, "validate", None)
+        return validate() if validate else True
     
     def _generate_final_command(self) -> None:
         """Generate the final bsub command"""
@@ -314,98 +299,129 @@ class BsubWizardApp(App):
             return
         
         # Generate the command
-        command = self.command_builder.build_command(self.job_config)
-        cost = self.command_builder.estimate_cost(self.job_config)
+        command, cost = self.get_command_and_cost()
         
-        # Show the final result
-        self.push_screen(ReviewScreen(
-            wizard_app=self,
-            job_config=self.job_config,
-            cluster_config=self.cluster_config,
-            final_command=command,
-            estimated_cost=cost
-        ))
+        # Show the final result on the review step's screen
+        review_screen = self._screen_cache.get(self.current_step)
+        if review_screen is not None:
+            review_screen.set_result(command, cost)
+    
+    def get_command_and_cost(self):
+        """Return the bsub command and estimated cost for the current job configuration
+        
+        The result is reused until the configuration's contents change.
+        """
+        key = json.dumps(self.job_config.to_dict(), sort_keys=True)
+        if self._command_cache is None or self._command_cache[0] != key:
+            command = self.command_builder.build_command(self.job_config)
+            cost = self.command_builder.estimate_cost(self.job_config)
+            self._command_cache = (key, command, cost)
+        return self._command_cache[1:]
     
     def show_error_message(self, title: str, messages: list) -> None:
         """Display error messages to the user"""
-        error_text = "\\n".join(messages)
-        self.push_screen(ErrorScreen(title, error_text))
+        error_text = messages[0] if len(messages) == 1 else "\n".join(messages)
+        self._show_message("error", title, error_text)
     
     def show_warning_message(self, title: str, message: str) -> None:
         """Display warning message to the user"""
-        self.push_screen(WarningScreen(title, message))
+        self._show_message("warning", title, message)
     
     def show_success_message(self, title: str, message: str) -> None:
         """Display success message to the user"""
-        self.push_screen(SuccessScreen(title, message))
+        self._show_message("success", title, message)
+    
+    def _show_message(self, kind: str, title: str, message: str) -> None:
+        """Show a message, reusing one installed MessageScreen per kind"""
+        name = f"{kind}-message"
+        if not self.is_screen_installed(name):
+            self.install_screen(MessageScreen(kind, title, message), name)
+        
+        screen = self.get_screen(name)
+        if screen in self.screen_stack:
+            # Already showing a message of this kind; stack a new one on top
+            self.push_screen(MessageScreen(kind, title, message))
+            return
+        
+        screen.set_message(title, message)
+        self.push_screen(screen)
     
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses"""
-        button_id = event.button.id
-        
-        if button_id == "next-button":
-            self.action_next()
-        elif button_id == "back-button":
-            self.action_back()
-        elif button_id == "save-button":
-            self.action_save_config()
-        elif button_id == "load-button":
-            self.action_load_config()
-        elif button_id == "help-button":
-            self.action_help()
+        handler = self._BUTTON_ACTIONS.get(event.button.id)
+        if handler:
+            getattr(self, handler)()
+
 
+# Styles for the dialog-style modal screens. Modal styles live with their
+# screens so they are only matched while one of them is showing.
+_DIALOG_TITLE_CSS = """
+.dialog-title {
+    text-align: center;
+    background: $primary;
+    color: $text;
+    padding: 1;
+    margin: 0 0 2 0;
+}
+"""
 
-class ErrorScreen(ModalScreen):
-    """Modal screen for displaying error messages"""
+_DIALOG_CSS = """
+.dialog-container {
+    background: $surface;
+    border: solid $primary;
+    padding: 2;
+    margin: 2;
+    width: 60%;
+    height: auto;
+    max-width: 80;
+}
+""" + _DIALOG_TITLE_CSS
+
+
+class MessageScreen(ModalScreen):
+    """Modal screen for displaying an error, warning or success message"""
     
-    def __init__(self, title: str, message: str):
-        super().__init__()
-        self.title = title
-        self.message = message
+    DEFAULT_CSS = """
+    .error-message, .warning-message, .success-message {
+        color: $text;
+        padding: 1;
+        margin: 1;
+    }
     
-    def compose(self) -> ComposeResult:
-        with Container(classes="error-message"):
-            yield Static(f"❌ {self.title}", classes="error-title")
-            yield Static(self.message)
-            yield Button("OK", id="ok-button", classes="primary")
+    .error-message {
+        background: $error;
+    }
     
-    def on_button_pressed(self, event: Button.Pressed) -> None:
-        if event.button.id == "ok-button":
-            self.dismiss()
-
-
-class WarningScreen(ModalScreen):
-    """Modal screen for displaying warning messages"""
+    .warning-message {
+        background: $warning;
+    }
     
-    def __init__(self, title: str, message: str):
+    .success-message {
+        background: $success;
+    }
+    """
+    
+    _ICONS: ClassVar[Dict[str, str]] = {"error": "❌", "warning": "⚠️", "success": "✅"}
+    
+    def __init__(self, kind: str, title: str, message: str):
         super().__init__()
+        self.kind = kind
         self.title = title
         self.message = message
     
     def compose(self) -> ComposeResult:
-        with Container(classes="warning-message"):
-            yield Static(f"⚠️ {self.title}", classes="warning-title")
-            yield Static(self.message)
+        with Container(classes=f"{self.kind}-message"):
+            yield Static(f"{self._ICONS[self.kind]} {self.title}", id="message-title", classes=f"{self.kind}-title")
+            yield Static(self.message, id="message-body")
             yield Button("OK", id="ok-button", classes="primary")
     
-    def on_button_pressed(self, event: Button.Pressed) -> None:
-        if event.button.id == "ok-button":
-            self.dismiss()
-
-
-class SuccessScreen(ModalScreen):
-    """Modal screen for displaying success messages"""
-    
-    def __init__(self, title: str, message: str):
-        super().__init__()
+    def set_message(self, title: str, message: str) -> None:
+        """Change the title and message, e.g. before the screen is shown again"""
         self.title = title
         self.message = message
-    
-    def compose(self) -> ComposeResult:
-        with Container(classes="success-message"):
-            yield Static(f"✅ {self.title}", classes="success-title")
-            yield Static(self.message)
-            yield Button("OK", id="ok-button", classes="primary")
+        if self.is_mounted:
+            self.query_one("#message-title", Static).update(f"{self._ICONS[self.kind]} {title}")
+            self.query_one("#message-body", Static).update(message)
     
     def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "ok-button":
@@ -415,6 +431,8 @@ class SuccessScreen(ModalScreen):
 class SaveConfigScreen(ModalScreen):
     """Modal screen for saving configuration"""
     
+    DEFAULT_CSS = _DIALOG_CSS
+    
     BINDINGS = [
         Binding("escape", "dismiss", "Cancel", priority=True),
     ]
@@ -453,34 +471,51 @@ class SaveConfigScreen(ModalScreen):
             config_name = name_input.value.strip()
             
             if not config_name:
-                self.app.push_screen(ErrorScreen("Invalid Name", "Please enter a configuration name"))
+                self.app.show_error_message("Invalid Name", ["Please enter a configuration name"])
                 return
             
             # Create configs directory if it doesn't exist
             configs_dir = Path("configs")
             configs_dir.mkdir(exist_ok=True)
             
-            # Save configuration
+            # Snapshot the configuration here; the file is written off the UI thread
             config_file = configs_dir / f"{config_name}.json"
             config_data = self.job_config.to_dict()
             
-            with open(config_file, 'w') as f:
-                json.dump(config_data, f, indent=2)
-            
-            # First dismiss this modal, then show success
+            app = self.app
             self.dismiss()
-            self.app.push_screen(SuccessScreen(
-                "Configuration Saved", 
-                f"Configuration saved as '{config_name}'"
-            ))
+            app.run_worker(
+                lambda: self._write_config(app, config_file, config_data, config_name),
+                group="config-io", thread=True, exit_on_error=False,
+            )
             
         except Exception as e:
-            self.app.push_screen(ErrorScreen("Save Error", f"Failed to save configuration: {str(e)}"))
+            self.app.show_error_message("Save Error", [f"Failed to save configuration: {str(e)}"])
+    
+    @staticmethod
+    def _write_config(app, config_file: Path, config_data: dict, config_name: str) -> None:
+        """Write a configuration file (runs in a worker thread)"""
+        try:
+            config_file.write_text(json.dumps(config_data, indent=2))
+        except Exception as e:
+            app.call_from_thread(app.show_error_message, "Save Error", [f"Failed to save configuration: {str(e)}"])
+        else:
+            # The configs directory mtime may be too coarse to show the new file
+            app.call_from_thread(LoadConfigScreen.clear_options_cache)
+            app.call_from_thread(app.show_success_message,
+                "Configuration Saved",
+                f"Configuration saved as '{config_name}'"
+            )
 
 
 class LoadConfigScreen(ModalScreen):
     """Modal screen for loading configuration"""
     
+    # (configs directory mtime, select options) from the last scan
+    _options_cache = None
+    
+    DEFAULT_CSS = _DIALOG_CSS
+    
     BINDINGS = [
         Binding("escape", "dismiss", "Cancel", priority=True),
     ]
@@ -498,21 +533,37 @@ class LoadConfigScreen(ModalScreen):
                 yield Button("Cancel", id="modal-cancel-button", classes="secondary")
                 yield Button("Load", id="modal-load-button", classes="primary")
     
+    @classmethod
+    def clear_options_cache(cls) -> None:
+        """Forget the scanned configurations so the next list is rescanned"""
+        cls._options_cache = None
+    
     def _get_config_options(self):
-        """Get list of available configuration files"""
-        configs_dir = Path("configs")
-        if not configs_dir.exists():
-            return [("No saved configurations", "")]
+        """Get list of available configuration files
         
-        config_files = list(configs_dir.glob("*.json"))
-        if not config_files:
+        The scan is cached until the configs directory's mtime changes,
+        which happens whenever a configuration is added or removed.
+        """
+        configs_dir = "configs"
+        try:
+            mtime = os.stat(configs_dir).st_mtime
+        except OSError:
             return [("No saved configurations", "")]
         
-        options = []
-        for config_file in config_files:
-            name = config_file.stem
-            options.append((name, str(config_file)))
+        cache = LoadConfigScreen._options_cache
+        if cache is not None and cache[0] == mtime:
+            return cache[1]
         
+        with os.scandir(configs_dir) as entries:
+            options = [
+                (entry.name[:-len(".json")], entry.path)
+                for entry in entries
+                if entry.name.endswith(".json") and entry.is_file()
+            ]
+        if not options:
+            options = [("No saved configurations", "")]
+        
+        LoadConfigScreen._options_cache = (mtime, options)
         return options
     
     def on_button_pressed(self, event: Button.Pressed) -> None:
@@ -527,43 +578,45 @@ class LoadConfigScreen(ModalScreen):
         config_file_path = config_select.value
         
         if not config_file_path:
-            self.app.push_screen(ErrorScreen("No Selection", "Please select a configuration to load"))
+            self.app.show_error_message("No Selection", ["Please select a configuration to load"])
             return
         
+        app = self.app
+        self.dismiss()
+        app.run_worker(
+            lambda: self._read_config(app, config_file_path),
+            group="config-io", thread=True, exit_on_error=False,
+        )
+    
+    def _read_config(self, app, config_file_path: str) -> None:
+        """Read a configuration file (runs in a worker thread)"""
+        try:
+            config_data = json.loads(Path(config_file_path).read_text())
+        except Exception as e:
+            app.call_from_thread(app.show_error_message, "Load Error", [f"Failed to load configuration: {str(e)}"])
+        else:
+            app.call_from_thread(self._apply_config, config_data, Path(config_file_path).stem)
+    
+    def _apply_config(self, config_data: dict, config_name: str) -> None:
+        """Load configuration data into the wizard (on the UI thread)"""
         try:
-            with open(config_file_path, 'r') as f:
-                config_data = json.load(f)
-            
-            # Load configuration into job_config
             self.wizard_app.job_config.from_dict(config_data)
             
-            # Refresh current step to show loaded values
+            # Rebuild the step screens to show loaded values
+            self.wizard_app.discard_screens()
             self.wizard_app.show_current_step()
             
-            config_name = Path(config_file_path).stem
-            
-            # First dismiss this modal, then show success
-            self.dismiss()
-            self.app.push_screen(SuccessScreen(
-                "Configuration Loaded", 
+            self.wizard_app.show_success_message(
+                "Configuration Loaded",
                 f"Configuration '{config_name}' loaded successfully"
-            ))
+            )
             
         except Exception as e:
-            self.app.push_screen(ErrorScreen("Load Error", f"Failed to load configuration: {str(e)}"))
+            self.wizard_app.show_error_message("Load Error", [f"Failed to load configuration: {str(e)}"])
 
 
-class HelpScreen(ModalScreen):
-    """Modal screen for displaying help information"""
-    
-    BINDINGS = [
-        Binding("escape", "dismiss", "Close", priority=True),
-    ]
-    
-    def compose(self) -> ComposeResult:
-        with Container(classes="help-container"):
-            yield Static("❓ BSub Wizard Help", classes="dialog-title")
-            yield Static("""
+# Help text, parsed once rather than each time the help screen is built
+_HELP_TEXT = Text.from_markup("""
 **Navigation:**
 • Use Next/Back buttons or Enter/Escape keys
 • Arrow keys navigate within selections
@@ -589,15 +642,34 @@ class HelpScreen(ModalScreen):
 • Use 'short' queue for testing (1 hour limit)
 
 For more help, see: https://wiki.int.janelia.org/
-            """)
+""")
+
+
+class HelpScreen(ModalScreen):
+    """Modal screen for displaying help information"""
+    
+    DEFAULT_CSS = """
+    .help-container {
+        background: $surface;
+        border: solid $primary;
+        padding: 2;
+        margin: 2;
+        width: 80%;
+        height: 80%;
+        max-width: 120;
+    }
+    """ + _DIALOG_TITLE_CSS
+    
+    BINDINGS = [
+        Binding("escape", "dismiss", "Close", priority=True),
+    ]
+    
+    def compose(self) -> ComposeResult:
+        with Container(classes="help-container"):
+            yield Static("❓ BSub Wizard Help", classes="dialog-title")
+            yield Static(_HELP_TEXT)
             yield Button("Close", id="close-button", classes="primary")
     
     def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "close-button":
             self.dismiss()
-
-
-def run_wizard():
-    """Entry point to run the BSub Wizard"""
-    app = BsubWizardApp()
-    app.run()
\ No newline at end of file
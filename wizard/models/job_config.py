@@ -1,20 +1,62 @@
-from dataclasses import dataclass, field
+from dataclasses import MISSING, dataclass, field, fields
+from functools import lru_cache
 from typing import Optional, Dict, Any, List
 from enum import Enum
+import re
 
 
-class JobType(Enum):
+# MM (up to 59999) or HH:MM (hours up to 999, minutes up to 59); leading
+# zeros are allowed, as int() would accept them
+_TIME_FORMAT = re.compile(r"0*[0-9]{1,3}:0*[0-5]?[0-9]|0*(?:[0-5][0-9]{4}|[0-9]{1,4})")
+
+
+@lru_cache(maxsize=256)
+def _is_valid_time_format(time_str: str) -> bool:
+    """Check if time string is in valid MM or HH:MM format"""
+    return _TIME_FORMAT.fullmatch(time_str) is not None
+
+
+# Whitespace or any of the words LSF reserves; "int" only as a whole word,
+# so names like "print_results" or "interp_job" are allowed
+_JOB_NAME_INVALID = re.compile(r"\s|spark|janelia|master|\bint\b").search
+
+
+@lru_cache(maxsize=64)
+def _parse_runtime_hours(runtime: str) -> float:
+    """Convert an MM or HH:MM runtime to hours"""
+    if ':' in runtime:
+        hours, minutes = map(int, runtime.split(':'))
+        return hours + minutes / 60
+    return int(runtime) / 60
+
+
+class JobType(str, Enum):
     CPU = "cpu"
     GPU = "gpu"
     INTERACTIVE = "interactive"
     MPI = "mpi"
 
 
-class GPUMode(Enum):
+class GPUMode(str, Enum):
     SHARED = "shared"
     EXCLUSIVE_PROCESS = "exclusive_process"
 
 
+@lru_cache(maxsize=256)
+def _build_gpu_string(num_gpus: int, gpu_mode: GPUMode, mps: bool, j_exclusive: bool,
+                      gpu_type: str, min_memory: Optional[str], nvlink: bool) -> str:
+    """Build the bsub -gpu string for one combination of GPU settings"""
+    return (
+        f"num={num_gpus}"
+        + (f":mode={gpu_mode.value}" if gpu_mode != GPUMode.EXCLUSIVE_PROCESS else "")
+        + (":mps=yes" if mps else "")
+        + (":j_exclusive=no" if not j_exclusive else "")
+        + (f":gmodel={gpu_type}" if gpu_type else "")
+        + (f":gmem={min_memory}" if min_memory else "")
+        + (":nvlink=yes" if nvlink else "")
+    )
+
+
 @dataclass
 class GPUConfiguration:
     gpu_type: str = ""
@@ -27,27 +69,38 @@ class GPUConfiguration:
     
     def to_gpu_string(self) -> str:
         """Convert GPU configuration to bsub -gpu parameter string"""
-        parts = [f"num={self.num_gpus}"]
-        
-        if self.gpu_mode != GPUMode.EXCLUSIVE_PROCESS:
-            parts.append(f"mode={self.gpu_mode.value}")
-        
-        if self.mps:
-            parts.append("mps=yes")
-        
-        if not self.j_exclusive:
-            parts.append("j_exclusive=no")
-            
-        if self.gpu_type:
-            parts.append(f"gmodel={self.gpu_type}")
-            
-        if self.min_memory:
-            parts.append(f"gmem={self.min_memory}")
-            
-        if self.nvlink:
-            parts.append("nvlink=yes")
+        return _build_gpu_string(self.num_gpus, self.gpu_mode, self.mps, self.j_exclusive,
+                                 self.gpu_type, self.min_memory, self.nvlink)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert GPU configuration to dictionary for serialization"""
+        return {
+            'gpu_type': self.gpu_type,
+            'num_gpus': self.num_gpus,
+            'gpu_mode': self.gpu_mode,
+            'mps': self.mps,
+            'nvlink': self.nvlink,
+            'min_memory': self.min_memory,
+            'j_exclusive': self.j_exclusive,
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "GPUConfiguration":
+        """Create a GPU configuration from its dictionary form
         
-        return ":".join(parts)
+        The fields are set directly, skipping the generated __init__.
+        """
+        config = object.__new__(cls)
+        config.__dict__.update(
+            gpu_type=data.get('gpu_type', ''),
+            num_gpus=data.get('num_gpus', 1),
+            gpu_mode=GPUMode(data.get('gpu_mode', 'exclusive_process')),
+            mps=data.get('mps', False),
+            nvlink=data.get('nvlink', False),
+            min_memory=data.get('min_memory'),
+            j_exclusive=data.get('j_exclusive', True),
+        )
+        return config
 
 
 @dataclass
@@ -72,6 +125,32 @@ class ArrayJobConfig:
             array_spec += f"%{self.max_parallel}"
         
         return array_spec
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert array configuration to dictionary for serialization"""
+        return {
+            'enabled': self.enabled,
+            'start_index': self.start_index,
+            'end_index': self.end_index,
+            'step': self.step,
+            'max_parallel': self.max_parallel,
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ArrayJobConfig":
+        """Create an array configuration from its dictionary form
+        
+        The fields are set directly, skipping the generated __init__.
+        """
+        config = object.__new__(cls)
+        config.__dict__.update(
+            enabled=data.get('enabled', False),
+            start_index=data.get('start_index', 1),
+            end_index=data.get('end_index', 1),
+            step=data.get('step', 1),
+            max_parallel=data.get('max_parallel'),
+        )
+        return config
 
 
 @dataclass
@@ -122,65 +201,46 @@ class JobConfiguration:
     def is_valid(self) -> tuple[bool, List[str]]:
         """Validate the job configuration and return validation errors"""
         errors = []
+        append = errors.append
+        job_name = self.job_name
+        slots = self.slots
         
-        if not self.job_name.strip():
-            errors.append("Job name is required")
-        elif any(char in self.job_name for char in [' ', 'spark', 'janelia', 'master', 'int']):
-            errors.append("Job name cannot contain spaces or reserved words (spark, janelia, master, int)")
+        if not job_name.strip():
+            append("Job name is required")
+        elif _JOB_NAME_INVALID(job_name):
+            append("Job name cannot contain spaces or reserved words (spark, janelia, master, int)")
         
         if not self.command.strip():
-            errors.append("Command is required")
+            append("Command is required")
         
-        if self.slots < 1:
-            errors.append("Number of slots must be at least 1")
-        elif self.slots > 64:
-            errors.append("Number of slots cannot exceed 64")
+        if slots < 1:
+            append("Number of slots must be at least 1")
+        elif slots > 64:
+            append("Number of slots cannot exceed 64")
         
         if self.job_type == JobType.GPU:
-            if not self.gpu_config:
-                errors.append("GPU configuration is required for GPU jobs")
-            elif self.gpu_config.num_gpus < 1:
-                errors.append("Number of GPUs must be at least 1")
+            gpu_config = self.gpu_config
+            if not gpu_config:
+                append("GPU configuration is required for GPU jobs")
+            elif gpu_config.num_gpus < 1:
+                append("Number of GPUs must be at least 1")
         
-        if self.runtime_limit:
-            if not self._is_valid_time_format(self.runtime_limit):
-                errors.append("Runtime limit must be in format MM or HH:MM")
+        runtime_limit = self.runtime_limit
+        if runtime_limit and not _is_valid_time_format(runtime_limit):
+            append("Runtime limit must be in format MM or HH:MM")
         
-        if self.runtime_estimate:
-            if not self._is_valid_time_format(self.runtime_estimate):
-                errors.append("Runtime estimate must be in format MM or HH:MM")
+        runtime_estimate = self.runtime_estimate
+        if runtime_estimate and not _is_valid_time_format(runtime_estimate):
+            append("Runtime estimate must be in format MM or HH:MM")
         
-        return len(errors) == 0, errors
-    
-    def _is_valid_time_format(self, time_str: str) -> bool:
-        """Check if time string is in valid MM or HH:MM format"""
-        if ':' in time_str:
-            parts = time_str.split(':')
-            if len(parts) != 2:
-                return False
-            try:
-                hours, minutes = int(parts[0]), int(parts[1])
-                return 0 <= hours <= 999 and 0 <= minutes <= 59
-            except ValueError:
-                return False
-        else:
-            try:
-                minutes = int(time_str)
-                return 0 <= minutes <= 59999
-            except ValueError:
-                return False
+        return not errors, errors
     
     def estimate_cost(self, cluster_config: Dict[str, Any]) -> float:
         """Estimate the cost of running this job"""
         if not self.runtime_limit:
             return 0.0
         
-        # Parse runtime to hours
-        if ':' in self.runtime_limit:
-            hours, minutes = map(int, self.runtime_limit.split(':'))
-            runtime_hours = hours + minutes / 60
-        else:
-            runtime_hours = int(self.runtime_limit) / 60
+        runtime_hours = _parse_runtime_hours(self.runtime_limit)
         
         # CPU cost
         cpu_cost_per_slot_hour = cluster_config.get('cpu_cost_per_slot_hour', 0.05)
@@ -199,7 +259,7 @@ class JobConfiguration:
     def to_dict(self) -> Dict[str, Any]:
         """Convert configuration to dictionary for serialization"""
         data = {
-            'job_type': self.job_type.value,
+            'job_type': self.job_type,
             'job_name': self.job_name,
             'command': self.command,
             'slots': self.slots,
@@ -217,73 +277,43 @@ class JobConfiguration:
             'custom_resources': self.custom_resources,
             'environment_vars': self.environment_vars,
             'parallel_environment': self.parallel_environment,
+            'array_config': self.array_config.to_dict(),
         }
         
         # GPU configuration
         if self.gpu_config:
-            data['gpu_config'] = {
-                'gpu_type': self.gpu_config.gpu_type,
-                'num_gpus': self.gpu_config.num_gpus,
-                'gpu_mode': self.gpu_config.gpu_mode.value,
-                'mps': self.gpu_config.mps,
-                'nvlink': self.gpu_config.nvlink,
-                'min_memory': self.gpu_config.min_memory,
-                'j_exclusive': self.gpu_config.j_exclusive,
-            }
-        
-        # Array configuration
-        data['array_config'] = {
-            'enabled': self.array_config.enabled,
-            'start_index': self.array_config.start_index,
-            'end_index': self.array_config.end_index,
-            'step': self.array_config.step,
-            'max_parallel': self.array_config.max_parallel,
-        }
+            data['gpu_config'] = self.gpu_config.to_dict()
         
         return data
     
     def from_dict(self, data: Dict[str, Any]) -> None:
-        """Load configuration from dictionary"""
+        """Load configuration from dictionary
+        
+        This updates the configuration in place, since the step screens
+        hold on to the app's instance.
+        """
         self.job_type = JobType(data.get('job_type', 'cpu'))
-        self.job_name = data.get('job_name', '')
-        self.command = data.get('command', '')
-        self.slots = data.get('slots', 1)
-        self.queue = data.get('queue', '')
-        self.runtime_limit = data.get('runtime_limit')
-        self.runtime_estimate = data.get('runtime_estimate')
-        self.output_file = data.get('output_file')
-        self.error_file = data.get('error_file')
-        self.working_directory = data.get('working_directory')
-        self.email_notifications = data.get('email_notifications', False)
-        self.email_on_start = data.get('email_on_start', False)
-        self.x11_forwarding = data.get('x11_forwarding', False)
-        self.architecture_requirements = data.get('architecture_requirements', [])
-        self.license_requirements = data.get('license_requirements', {})
-        self.custom_resources = data.get('custom_resources', [])
-        self.environment_vars = data.get('environment_vars', {})
-        self.parallel_environment = data.get('parallel_environment')
+        
+        get = data.get
+        for name, default, default_factory in _LOADED_FIELDS:
+            if default_factory is MISSING:
+                setattr(self, name, get(name, default))
+            else:
+                value = get(name, MISSING)
+                setattr(self, name, default_factory() if value is MISSING else value)
         
         # GPU configuration
         gpu_data = data.get('gpu_config')
-        if gpu_data:
-            self.gpu_config = GPUConfiguration(
-                gpu_type=gpu_data.get('gpu_type', ''),
-                num_gpus=gpu_data.get('num_gpus', 1),
-                gpu_mode=GPUMode(gpu_data.get('gpu_mode', 'exclusive_process')),
-                mps=gpu_data.get('mps', False),
-                nvlink=gpu_data.get('nvlink', False),
-                min_memory=gpu_data.get('min_memory'),
-                j_exclusive=gpu_data.get('j_exclusive', True),
-            )
-        else:
-            self.gpu_config = None
+        self.gpu_config = GPUConfiguration.from_dict(gpu_data) if gpu_data else None
         
         # Array configuration
-        array_data = data.get('array_config', {})
-        self.array_config = ArrayJobConfig(
-            enabled=array_data.get('enabled', False),
-            start_index=array_data.get('start_index', 1),
-            end_index=array_data.get('end_index', 1),
-            step=array_data.get('step', 1),
-            max_parallel=array_data.get('max_parallel'),
-        )
\ No newline at end of file
+        self.array_config = ArrayJobConfig.from_dict(data.get('array_config', {}))
+
+
+# (name, default, default_factory) for the fields from_dict copies straight
+# from the loaded data; the enum and nested configurations are converted
+_LOADED_FIELDS = tuple(
+    (f.name, f.default, f.default_factory)
+    for f in fields(JobConfiguration)
+    if f.name not in ('job_type', 'gpu_config', 'array_config')
+)
@@ -3,9 +3,28 @@ from textual.containers import Container, Vertical, Horizontal, Grid
 from textual.widgets import Static, Input, Select, Checkbox, Button, Markdown
 from textual.widget import Widget
 
+from ..models.job_config import JobType
 from ..utils.validators import JobValidator
 
 
+# (label, value) choices for the screen's dropdowns
+_ARCH_OPTIONS = (
+    ("Any (fastest scheduling)", "any"),
+    ("AVX2 compatible", "avx2"),
+    ("AVX512 compatible", "avx512"),
+    ("AMX compatible (Sapphire Rapids only)", "amx"),
+)
+
+_PARALLEL_ENV_OPTIONS = (
+    ("None", "none"),
+    ("parallel-48", "parallel-48"),
+    ("Custom", "custom"),
+)
+
+# Sections a custom LSF resource expression is expected to start with
+_LSF_RESOURCE_PREFIXES = ('select[', 'rusage[', 'order[')
+
+
 class AdvancedScreen(Widget):
     """Screen for advanced job configuration options"""
     
@@ -94,6 +113,19 @@ class AdvancedScreen(Widget):
         self.wizard_app = wizard_app
         self.job_config = job_config
         self.cluster_config = cluster_config
+        self._resources_timer = None
+        self._pending_resources = None
+        self._resources_text = None
+        
+        # Widgets used by the event handlers, cached in on_mount
+        self._idl_count_input = None
+        self._matlab_count_input = None
+        self._custom_parallel_input = None
+        self._env_name_input = None
+        self._env_value_input = None
+        self._env_vars_display = None
+        self._mpi_section = None
+        self._license_checkboxes = {}
     
     def compose(self) -> ComposeResult:
         """Create the advanced options layout"""
@@ -115,12 +147,7 @@ Configure advanced job requirements and optimizations. These options are typical
                     with Grid(classes="advanced-grid"):
                         with Container(classes="advanced-item"):
                             yield Static("CPU Architecture:")
-                            yield Select([
-                                ("Any (fastest scheduling)", "any"),
-                                ("AVX2 compatible", "avx2"),
-                                ("AVX512 compatible", "avx512"),
-                                ("AMX compatible (Sapphire Rapids only)", "amx")
-                            ], id="arch-requirement-select")
+                            yield Select(_ARCH_OPTIONS, id="arch-requirement-select")
                             yield Static("💡 Leave as 'Any' unless you need specific features", classes="help-text")
                         
                         with Container(classes="advanced-item"):
@@ -167,11 +194,7 @@ Configure advanced job requirements and optimizations. These options are typical
                     yield Static("🔄 **Parallel Processing Options**", classes="subsection-title")
                     
                     yield Static("Parallel Environment:")
-                    yield Select([
-                        ("None", "none"),
-                        ("parallel-48", "parallel-48"),
-                        ("Custom", "custom")
-                    ], id="parallel-env-select")
+                    yield Select(_PARALLEL_ENV_OPTIONS, id="parallel-env-select")
                     
                     yield Input(
                         placeholder="Custom parallel environment",
@@ -196,6 +219,20 @@ Use these settings for specialized requirements like:
     
     def on_mount(self) -> None:
         """Initialize the screen with current configuration"""
+        self._idl_count_input = self.query_one("#idl-count-input", Input)
+        self._matlab_count_input = self.query_one("#matlab-count-input", Input)
+        self._custom_parallel_input = self.query_one("#custom-parallel-input", Input)
+        self._env_name_input = self.query_one("#env-name-input", Input)
+        self._env_value_input = self.query_one("#env-value-input", Input)
+        self._env_vars_display = self.query_one("#env-vars-display", Static)
+        self._mpi_section = self.query_one("#mpi-section")
+        
+        # Checkbox id -> (license name, count input)
+        self._license_checkboxes = {
+            "idl-checkbox": ("idl", self._idl_count_input),
+            "matlab-checkbox": ("matlab", self._matlab_count_input),
+        }
+        
         # Architecture requirements
         arch_select = self.query_one("#arch-requirement-select", Select)
         if self.job_config.architecture_requirements:
@@ -212,14 +249,12 @@ Use these settings for specialized requirements like:
         if "idl" in self.job_config.license_requirements:
             idl_checkbox = self.query_one("#idl-checkbox", Checkbox)
             idl_checkbox.value = True
-            idl_count_input = self.query_one("#idl-count-input", Input)
-            idl_count_input.value = str(self.job_config.license_requirements["idl"])
+            self._idl_count_input.value = str(self.job_config.license_requirements["idl"])
         
         if "matlab" in self.job_config.license_requirements:
             matlab_checkbox = self.query_one("#matlab-checkbox", Checkbox)
             matlab_checkbox.value = True
-            matlab_count_input = self.query_one("#matlab-count-input", Input)
-            matlab_count_input.value = str(self.job_config.license_requirements["matlab"])
+            self._matlab_count_input.value = str(self.job_config.license_requirements["matlab"])
         
         # Parallel environment
         parallel_env_select = self.query_one("#parallel-env-select", Select)
@@ -228,8 +263,7 @@ Use these settings for specialized requirements like:
                 parallel_env_select.value = "parallel-48"
             else:
                 parallel_env_select.value = "custom"
-                custom_parallel_input = self.query_one("#custom-parallel-input", Input)
-                custom_parallel_input.value = self.job_config.parallel_environment
+                self._custom_parallel_input.value = self.job_config.parallel_environment
         else:
             parallel_env_select.value = "none"
         
@@ -239,9 +273,7 @@ Use these settings for specialized requirements like:
     
     def _toggle_mpi_section(self) -> None:
         """Show/hide MPI section based on job type"""
-        from ..models.job_config import JobType
-        mpi_section = self.query_one("#mpi-section")
-        mpi_section.display = (self.job_config.job_type == JobType.MPI)
+        self._mpi_section.display = (self.job_config.job_type == JobType.MPI)
     
     def on_select_changed(self, event: Select.Changed) -> None:
         """Handle select dropdown changes"""
@@ -257,46 +289,59 @@ Use these settings for specialized requirements like:
             elif event.value == "parallel-48":
                 self.job_config.parallel_environment = "parallel-48"
             elif event.value == "custom":
-                custom_parallel_input = self.query_one("#custom-parallel-input", Input)
-                custom_parallel_input.display = True
+                self._custom_parallel_input.display = True
             
             # Hide custom input for non-custom selections
             if event.value != "custom":
-                custom_parallel_input = self.query_one("#custom-parallel-input", Input)
-                custom_parallel_input.display = False
+                self._custom_parallel_input.display = False
+    
+    def on_unmount(self) -> None:
+        """Drop pending custom resources text; a discarded screen's text is stale"""
+        if self._resources_timer is not None:
+            self._resources_timer.stop()
+            self._resources_timer = None
+        self._pending_resources = None
     
     def on_input_changed(self, event: Input.Changed) -> None:
         """Handle input field changes"""
         if event.input.id == "custom-resources-input":
-            if event.value.strip():
-                # Split by | for multiple resources
-                resources = [r.strip() for r in event.value.split("|") if r.strip()]
-                self.job_config.custom_resources = resources
-            else:
-                self.job_config.custom_resources = []
+            # Only the final value matters, so parse once typing pauses
+            if self._resources_timer is not None:
+                self._resources_timer.stop()
+            self._pending_resources = event.value
+            self._resources_timer = self.set_timer(0.2, self._commit_custom_resources)
         
         elif event.input.id == "custom-parallel-input":
             self.job_config.parallel_environment = event.value if event.value else None
     
+    def _commit_custom_resources(self) -> None:
+        """Store any pending custom resources text in the job configuration"""
+        if self._resources_timer is not None:
+            self._resources_timer.stop()
+            self._resources_timer = None
+        if self._pending_resources is None:
+            return
+        
+        value, self._pending_resources = self._pending_resources, None
+        if value == self._resources_text:
+            return
+        
+        # Split by | for multiple resources
+        self._resources_text = value
+        self.job_config.custom_resources = [r.strip() for r in value.split("|") if r.strip()]
+    
     def on_checkbox_changed(self, event: Checkbox.Changed) -> None:
         """Handle checkbox changes"""
-        if event.checkbox.id == "idl-checkbox":
-            if event.value:
-                # Get count from input or default to 1
-                idl_count_input = self.query_one("#idl-count-input", Input)
-                count = int(idl_count_input.value) if idl_count_input.value else 1
-                self.job_config.license_requirements["idl"] = count
-            else:
-                self.job_config.license_requirements.pop("idl", None)
+        license_entry = self._license_checkboxes.get(event.checkbox.id)
+        if license_entry is None:
+            return
         
-        elif event.checkbox.id == "matlab-checkbox":
-            if event.value:
-                # Get count from input or default to 1
-                matlab_count_input = self.query_one("#matlab-count-input", Input)
-                count = int(matlab_count_input.value) if matlab_count_input.value else 1
-                self.job_config.license_requirements["matlab"] = count
-            else:
-                self.job_config.license_requirements.pop("matlab", None)
+        license_name, count_input = license_entry
+        if event.value:
+            # Get count from input or default to 1
+            self.job_config.license_requirements[license_name] = int(count_input.value or "1")
+        else:
+            self.job_config.license_requirements.pop(license_name, None)
     
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses"""
@@ -307,8 +352,8 @@ Use these settings for specialized requirements like:
     
     def _add_environment_variable(self) -> None:
         """Add a new environment variable"""
-        env_name_input = self.query_one("#env-name-input", Input)
-        env_value_input = self.query_one("#env-value-input", Input)
+        env_name_input = self._env_name_input
+        env_value_input = self._env_value_input
         
         var_name = env_name_input.value.strip()
         var_value = env_value_input.value.strip()
@@ -340,26 +385,23 @@ Use these settings for specialized requirements like:
     
     def _update_env_vars_display(self) -> None:
         """Update the environment variables display"""
-        env_vars_display = self.query_one("#env-vars-display", Static)
-        
-        if self.job_config.environment_vars:
-            env_lines = []
-            for var_name, var_value in self.job_config.environment_vars.items():
-                env_lines.append(f"{var_name}={var_value}")
-            env_vars_display.update("\\n".join(env_lines))
-        else:
-            env_vars_display.update("No environment variables set")
+        env_text = "\n".join(
+            f"{var_name}={var_value}"
+            for var_name, var_value in self.job_config.environment_vars.items()
+        )
+        self._env_vars_display.update(env_text or "No environment variables set")
     
     def validate(self) -> bool:
         """Validate advanced configuration"""
         errors = []
         warnings = []
         
-        # Validate custom resources
+        # Validate custom resources, including any still being typed
+        self._commit_custom_resources()
         for resource in self.job_config.custom_resources:
             if not resource.strip():
                 errors.append("Empty custom resource expression")
-            elif not resource.startswith(('select[', 'rusage[', 'order[')):
+            elif not resource.startswith(_LSF_RESOURCE_PREFIXES):
                 warnings.append(f"Custom resource '{resource}' may not be a valid LSF expression")
         
         # Validate license counts
@@ -376,7 +418,6 @@ Use these settings for specialized requirements like:
                 errors.append(f"Environment variable {var_name}: {error}")
         
         # Validate parallel environment for MPI jobs
-        from ..models.job_config import JobType
         if self.job_config.job_type == JobType.MPI:
             if not self.job_config.parallel_environment:
                 errors.append("Parallel environment is required for MPI jobs")
@@ -392,6 +433,6 @@ Use these settings for specialized requirements like:
         
         # Show warnings
         if warnings:
-            self.wizard_app.show_warning_message("Advanced Configuration Warnings", "\\n".join(warnings))
+            self.wizard_app.show_warning_message("Advanced Configuration Warnings", "\n".join(warnings))
         
         return True
\ No newline at end of file
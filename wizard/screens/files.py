@@ -6,6 +6,18 @@ from textual.widget import Widget
 from ..utils.validators import JobValidator
 
 
+# Where job files and working directories are expected to live
+_DIRECTORY_PREFIXES = ('/groups', '/nrs', '/scratch')
+_FILE_PREFIXES = _DIRECTORY_PREFIXES + ('/dev',)
+
+# Path input id -> job configuration field it sets
+_PATH_INPUTS = {
+    "output-file-input": "output_file",
+    "error-file-input": "error_file",
+    "working-dir-input": "working_directory",
+}
+
+
 class FilesScreen(Widget):
     """Screen for configuring file management options"""
     
@@ -75,6 +87,12 @@ class FilesScreen(Widget):
         self.wizard_app = wizard_app
         self.job_config = job_config
         self.cluster_config = cluster_config
+        self._paths_timer = None
+        self._pending_paths = {}
+        
+        # Widgets used by the event handlers, cached in on_mount
+        self._output_file_input = None
+        self._suppress_email_checkbox = None
     
     def compose(self) -> ComposeResult:
         """Create the file management layout"""
@@ -155,9 +173,11 @@ Configure input/output files and working directories. Proper file management is
     
     def on_mount(self) -> None:
         """Initialize the screen with current configuration"""
+        self._output_file_input = self.query_one("#output-file-input", Input)
+        self._suppress_email_checkbox = self.query_one("#suppress-email-checkbox", Checkbox)
+        
         # Set current values
-        output_file_input = self.query_one("#output-file-input", Input)
-        output_file_input.value = self.job_config.output_file or ""
+        self._output_file_input.value = self.job_config.output_file or ""
         
         error_file_input = self.query_one("#error-file-input", Input)
         error_file_input.value = self.job_config.error_file or ""
@@ -165,15 +185,14 @@ Configure input/output files and working directories. Proper file management is
         working_dir_input = self.query_one("#working-dir-input", Input)
         working_dir_input.value = self.job_config.working_directory or ""
         
-        suppress_email_checkbox = self.query_one("#suppress-email-checkbox", Checkbox)
-        suppress_email_checkbox.value = (self.job_config.output_file == "/dev/null")
+        self._suppress_email_checkbox.value = (self.job_config.output_file == "/dev/null")
         
         # Set intelligent defaults based on job type
         self._set_default_paths()
     
     def _set_default_paths(self) -> None:
         """Set intelligent default file paths"""
-        output_file_input = self.query_one("#output-file-input", Input)
+        output_file_input = self._output_file_input
         error_file_input = self.query_one("#error-file-input", Input)
         
         # Only set defaults if fields are empty
@@ -185,24 +204,43 @@ Configure input/output files and working directories. Proper file management is
                 output_file_input.placeholder = f"/groups/yourlab/{self.job_config.job_name}.log"
                 error_file_input.placeholder = f"/groups/yourlab/{self.job_config.job_name}.err"
     
+    def on_unmount(self) -> None:
+        """Drop pending path edits; a discarded screen's text is stale"""
+        if self._paths_timer is not None:
+            self._paths_timer.stop()
+            self._paths_timer = None
+        self._pending_paths = {}
+    
     def on_input_changed(self, event: Input.Changed) -> None:
         """Handle input field changes"""
-        if event.input.id == "output-file-input":
-            self.job_config.output_file = event.value if event.value else None
+        field_name = _PATH_INPUTS.get(event.input.id)
+        if field_name is None:
+            return
+        
+        # Store the paths once typing pauses rather than on every keystroke
+        self._pending_paths[field_name] = event.value
+        if self._paths_timer is not None:
+            self._paths_timer.stop()
+        self._paths_timer = self.set_timer(0.15, self._commit_paths)
+    
+    def _commit_paths(self) -> None:
+        """Store any pending path input values in the job configuration"""
+        if self._paths_timer is not None:
+            self._paths_timer.stop()
+            self._paths_timer = None
+        
+        pending, self._pending_paths = self._pending_paths, {}
+        for field_name, value in pending.items():
+            setattr(self.job_config, field_name, value if value else None)
+        
+        if "output_file" in pending:
             # Update suppress email checkbox
-            suppress_checkbox = self.query_one("#suppress-email-checkbox", Checkbox)
-            suppress_checkbox.value = (event.value == "/dev/null")
-            
-        elif event.input.id == "error-file-input":
-            self.job_config.error_file = event.value if event.value else None
-            
-        elif event.input.id == "working-dir-input":
-            self.job_config.working_directory = event.value if event.value else None
+            self._suppress_email_checkbox.value = (pending["output_file"] == "/dev/null")
     
     def on_checkbox_changed(self, event: Checkbox.Changed) -> None:
         """Handle checkbox changes"""
         if event.checkbox.id == "suppress-email-checkbox":
-            output_file_input = self.query_one("#output-file-input", Input)
+            output_file_input = self._output_file_input
             
             if event.value:
                 # Set to /dev/null to suppress output
@@ -224,34 +262,31 @@ Configure input/output files and working directories. Proper file management is
         }
         return suggestions.get(file_type, "/groups/yourlab/")
     
+    @staticmethod
+    def _check_path(label: str, path: str, prefixes: tuple, errors: list, warnings: list) -> None:
+        """Validate one configured path, recording any error or warning"""
+        if not path:
+            return
+        
+        valid, error = JobValidator.validate_file_path(path)
+        if not valid:
+            errors.append(f"{label}: {error}")
+        elif not path.startswith(prefixes):
+            warnings.append(f"{label} should typically be in /groups, /nrs, or /scratch")
+    
     def validate(self) -> bool:
         """Validate file configuration"""
         errors = []
         warnings = []
         
-        # Validate output file path
-        if self.job_config.output_file:
-            valid, error = JobValidator.validate_file_path(self.job_config.output_file)
-            if not valid:
-                errors.append(f"Output file: {error}")
-            elif not self.job_config.output_file.startswith(('/groups', '/nrs', '/scratch', '/dev')):
-                warnings.append("Output file should typically be in /groups, /nrs, or /scratch")
-        
-        # Validate error file path
-        if self.job_config.error_file:
-            valid, error = JobValidator.validate_file_path(self.job_config.error_file)
-            if not valid:
-                errors.append(f"Error file: {error}")
-            elif not self.job_config.error_file.startswith(('/groups', '/nrs', '/scratch', '/dev')):
-                warnings.append("Error file should typically be in /groups, /nrs, or /scratch")
+        # Include any path that is still being typed
+        self._commit_paths()
         
-        # Validate working directory
-        if self.job_config.working_directory:
-            valid, error = JobValidator.validate_file_path(self.job_config.working_directory)
-            if not valid:
-                errors.append(f"Working directory: {error}")
-            elif not self.job_config.working_directory.startswith(('/groups', '/nrs', '/scratch')):
-                warnings.append("Working directory should typically be in /groups, /nrs, or /scratch")
+        # Validate output/error file paths and working directory
+        config = self.job_config
+        self._check_path("Output file", config.output_file, _FILE_PREFIXES, errors, warnings)
+        self._check_path("Error file", config.error_file, _FILE_PREFIXES, errors, warnings)
+        self._check_path("Working directory", config.working_directory, _DIRECTORY_PREFIXES, errors, warnings)
         
         # Check for potential issues
         if self.job_config.output_file and self.job_config.error_file:
@@ -276,6 +311,6 @@ Configure input/output files and working directories. Proper file management is
         
         # Show warnings
         if warnings:
-            self.wizard_app.show_warning_message("File Configuration Warnings", "\\n".join(warnings))
+            self.wizard_app.show_warning_message("File Configuration Warnings", "\n".join(warnings))
         
         return True
\ No newline at end of file
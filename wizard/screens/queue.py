@@ -263,7 +263,7 @@ Choose the appropriate queue for your job. Queues have different resource limits
                 description_parts.append(f"- {issue}")
         
         description_text = self.query_one("#queue-description", Static)
-        description_text.update("\\n".join(description_parts))
+        description_text.update("\n".join(description_parts))
     
     def _get_queue_recommendations(self, queue_name: str) -> list:
         """Get usage recommendations for a specific queue"""
@@ -364,7 +364,7 @@ Choose the appropriate queue for your job. Queues have different resource limits
             if compatibility_issues:
                 self.wizard_app.show_warning_message(
                     "Compatibility Issues", 
-                    "\\n".join(compatibility_issues) + "\\n\\nDo you want to continue anyway?"
+                    "\n".join(compatibility_issues) + "\n\nDo you want to continue anyway?"
                 )
                 # For now, continue despite warnings
         
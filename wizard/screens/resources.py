@@ -8,6 +8,20 @@ from ..models.job_config import JobType
 from ..utils.validators import JobValidator
 
 
+# (label, value) choices for the screen's dropdowns
+_ARCH_OPTIONS = (
+    ("Any (recommended)", "any"),
+    ("AVX2 compatible", "avx2"),
+    ("AVX512 compatible", "avx512"),
+    ("AMX compatible (Sapphire Rapids)", "amx"),
+)
+
+_GPU_MODE_OPTIONS = (
+    ("Exclusive Process (recommended)", "exclusive_process"),
+    ("Shared", "shared"),
+)
+
+
 class ResourcesScreen(Widget):
     """Screen for configuring resource allocation"""
     
@@ -115,12 +129,7 @@ Configure the computational resources for your job. Resource allocation affects
                         
                         with Container(classes="resource-item"):
                             yield Static("Architecture Preference:")
-                            yield Select([
-                                ("Any (recommended)", "any"),
-                                ("AVX2 compatible", "avx2"),
-                                ("AVX512 compatible", "avx512"),
-                                ("AMX compatible (Sapphire Rapids)", "amx")
-                            ], id="arch-select")
+                            yield Select(_ARCH_OPTIONS, id="arch-select")
                             yield Static("💡 'Any' provides fastest scheduling", classes="help-text")
                 
                 # GPU Resources (shown only for GPU jobs)
@@ -144,10 +153,7 @@ Configure the computational resources for your job. Resource allocation affects
                         
                         with Container(classes="resource-item"):
                             yield Static("GPU Mode:")
-                            yield Select([
-                                ("Exclusive Process (recommended)", "exclusive_process"),
-                                ("Shared", "shared")
-                            ], id="gpu-mode-select")
+                            yield Select(_GPU_MODE_OPTIONS, id="gpu-mode-select")
                             yield Static("💡 Exclusive gives better performance", classes="help-text")
                         
                         with Container(classes="resource-item"):
@@ -299,7 +305,7 @@ Configure the computational resources for your job. Resource allocation affects
             cost = self.wizard_app.command_builder.estimate_cost(self.job_config)
             estimates.append(f"**Estimated Cost:** ${cost:.2f}")
         
-        estimates_text.update("\\n".join(estimates))
+        estimates_text.update("\n".join(estimates))
     
     def validate(self) -> bool:
         """Validate resource configuration"""
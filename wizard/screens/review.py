@@ -145,6 +145,17 @@ Review your job configuration and generated command. Make sure everything looks
     
     def on_mount(self) -> None:
         """Initialize the review screen"""
+        self._refresh_review()
+    
+    def set_result(self, final_command: str, estimated_cost: float) -> None:
+        """Show a newly generated command and cost estimate"""
+        self.final_command = final_command
+        self.estimated_cost = estimated_cost
+        if self.is_mounted:
+            self._refresh_review()
+    
+    def _refresh_review(self) -> None:
+        """Fill in the command, script, summary, cost and warnings"""
         self._generate_command_and_script()
         self._update_job_summary()
         self._update_cost_estimate()
@@ -154,7 +165,7 @@ Review your job configuration and generated command. Make sure everything looks
         """Generate the final command and script"""
         # Generate command if not provided
         if not self.final_command:
-            self.final_command = self.wizard_app.command_builder.build_command(self.job_config)
+            self.final_command, self.estimated_cost = self.wizard_app.get_command_and_cost()
         
         # Display command
         command_display = self.query_one("#command-display", TextArea)
@@ -205,7 +216,7 @@ Review your job configuration and generated command. Make sure everything looks
             summary_lines.append(f"**Working Directory:** {self.job_config.working_directory}")
         
         summary_text = self.query_one("#job-summary", Static)
-        summary_text.update("\\n".join(summary_lines))
+        summary_text.update("\n".join(summary_lines))
     
     def _update_cost_estimate(self) -> None:
         """Update the cost estimate display"""
@@ -257,7 +268,7 @@ Review your job configuration and generated command. Make sure everything looks
             ]
         
         cost_estimate = self.query_one("#cost-estimate", Static)
-        cost_estimate.update("\\n".join(cost_lines))
+        cost_estimate.update("\n".join(cost_lines))
     
     def _check_warnings(self) -> None:
         """Check for potential issues and show warnings"""
@@ -282,7 +293,7 @@ Review your job configuration and generated command. Make sure everything looks
         if warnings:
             warnings_section.display = True
             warnings_text = self.query_one("#warnings-text", Static)
-            warnings_text.update("\\n".join([f"• {w}" for w in warnings]))
+            warnings_text.update("\n".join([f"• {w}" for w in warnings]))
         else:
             warnings_section.display = False
     
@@ -311,7 +322,7 @@ Review your job configuration and generated command. Make sure everything looks
             # Fallback - show the command in a modal
             self.wizard_app.show_success_message(
                 "Copy Command", 
-                f"Copy this command:\\n\\n{self.final_command}"
+                f"Copy this command:\n\n{self.final_command}"
             )
     
     def _copy_script(self) -> None:
@@ -332,48 +343,11 @@ Review your job configuration and generated command. Make sure everything looks
     def _save_configuration(self) -> None:
         """Save the current configuration"""
         # Convert job config to dictionary for JSON serialization
-        config_dict = {
-            "job_type": self.job_config.job_type.value,
-            "job_name": self.job_config.job_name,
-            "command": self.job_config.command,
-            "slots": self.job_config.slots,
-            "queue": self.job_config.queue,
-            "runtime_limit": self.job_config.runtime_limit,
-            "runtime_estimate": self.job_config.runtime_estimate,
-            "output_file": self.job_config.output_file,
-            "error_file": self.job_config.error_file,
-            "working_directory": self.job_config.working_directory,
-            "email_notifications": self.job_config.email_notifications,
-            "email_on_start": self.job_config.email_on_start,
-            "x11_forwarding": self.job_config.x11_forwarding,
-            "architecture_requirements": self.job_config.architecture_requirements,
-            "license_requirements": self.job_config.license_requirements,
-            "custom_resources": self.job_config.custom_resources,
-            "environment_vars": self.job_config.environment_vars,
-            "parallel_environment": self.job_config.parallel_environment,
-        }
+        config_dict = self.job_config.to_dict()
         
-        # Add GPU config if present
-        if self.job_config.gpu_config:
-            config_dict["gpu_config"] = {
-                "gpu_type": self.job_config.gpu_config.gpu_type,
-                "num_gpus": self.job_config.gpu_config.num_gpus,
-                "gpu_mode": self.job_config.gpu_config.gpu_mode.value,
-                "mps": self.job_config.gpu_config.mps,
-                "nvlink": self.job_config.gpu_config.nvlink,
-                "min_memory": self.job_config.gpu_config.min_memory,
-                "j_exclusive": self.job_config.gpu_config.j_exclusive,
-            }
-        
-        # Add array config if enabled
-        if self.job_config.array_config.enabled:
-            config_dict["array_config"] = {
-                "enabled": True,
-                "start_index": self.job_config.array_config.start_index,
-                "end_index": self.job_config.array_config.end_index,
-                "step": self.job_config.array_config.step,
-                "max_parallel": self.job_config.array_config.max_parallel,
-            }
+        # Only record array settings for array jobs
+        if not self.job_config.array_config.enabled:
+            del config_dict["array_config"]
         
         # Create filename
         filename = f"{self.job_config.job_name or 'job_config'}.json"
@@ -405,7 +379,7 @@ Review your job configuration and generated command. Make sure everything looks
             
             self.wizard_app.show_success_message(
                 "Script Exported",
-                f"Job script exported to {filename}\\nMake it executable with: chmod +x {filename}"
+                f"Job script exported to {filename}\nMake it executable with: chmod +x {filename}"
             )
         except Exception as e:
             self.wizard_app.show_error_message(
@@ -418,6 +392,7 @@ Review your job configuration and generated command. Make sure everything looks
         # Reset the app state
         self.wizard_app.current_step = 0
         self.wizard_app.job_config = type(self.wizard_app.job_config)()  # Create new instance
+        self.wizard_app.discard_screens()
         self.wizard_app.show_current_step()
     
     def validate(self) -> bool:
@@ -137,6 +137,7 @@ Press **Next** to begin the wizard, or use the quick action buttons above for co
         self.job_config.command = "python my_script.py"
         
         # Jump to resources screen
+        self.wizard_app.discard_screens(1)
         self.wizard_app.current_step = 2
         self.wizard_app.show_current_step()
     
@@ -155,6 +156,7 @@ Press **Next** to begin the wizard, or use the quick action buttons above for co
         self.job_config.command = "python train.py"
         
         # Jump to resources screen
+        self.wizard_app.discard_screens(1)
         self.wizard_app.current_step = 2
         self.wizard_app.show_current_step()
     
@@ -170,6 +172,7 @@ Press **Next** to begin the wizard, or use the quick action buttons above for co
         self.job_config.command = "/bin/bash"
         
         # Jump to runtime screen
+        self.wizard_app.discard_screens(1)
         self.wizard_app.current_step = 4
         self.wizard_app.show_current_step()
     
@@ -1,5 +1,5 @@
 from typing import List, Dict, Any
-from ..models.job_config import JobConfiguration, JobType
+from ..models.job_config import JobConfiguration, JobType, _is_valid_time_format, _parse_runtime_hours
 
 
 class BsubCommandBuilder:
@@ -7,94 +7,98 @@ class BsubCommandBuilder:
     
     def __init__(self, cluster_config: Dict[str, Any]):
         self.cluster_config = cluster_config
+        
+        # Rates used by estimate_cost, looked up once
+        self._cpu_cost_per_slot_hour = cluster_config.get('cpu_cost_per_slot_hour', 0.05)
+        self._gpu_costs = cluster_config.get('gpu_costs', {})
     
     def build_command(self, config: JobConfiguration) -> str:
         """Generate the complete bsub command from configuration"""
         parts = ["bsub"]
+        append = parts.append
         
         # Job name
         if config.job_name:
             if config.array_config.enabled:
                 array_spec = config.array_config.to_array_string()
-                parts.append(f'-J "{config.job_name}{array_spec}"')
+                append(f'-J "{config.job_name}{array_spec}"')
             else:
-                parts.append(f'-J "{config.job_name}"')
+                append(f'-J "{config.job_name}"')
         
         # Number of slots
-        parts.append(f"-n {config.slots}")
+        append(f"-n {config.slots}")
         
         # Queue specification
         if config.queue:
-            parts.append(f"-q {config.queue}")
+            append(f"-q {config.queue}")
         
         # GPU configuration
         if config.job_type == JobType.GPU and config.gpu_config:
             gpu_string = config.gpu_config.to_gpu_string()
-            parts.append(f'-gpu "{gpu_string}"')
+            append(f'-gpu "{gpu_string}"')
         
         # Runtime limits
         if config.runtime_limit:
-            parts.append(f"-W {config.runtime_limit}")
+            append(f"-W {config.runtime_limit}")
         
         if config.runtime_estimate:
-            parts.append(f"-We {config.runtime_estimate}")
+            append(f"-We {config.runtime_estimate}")
         
         # Interactive session
         if config.job_type == JobType.INTERACTIVE:
-            parts.append("-Is")
+            append("-Is")
         
         # File handling
         if config.output_file:
-            parts.append(f"-o {config.output_file}")
+            append(f"-o {config.output_file}")
         elif not config.job_type == JobType.INTERACTIVE:
             # Default to /dev/null if no output file specified for non-interactive jobs
-            parts.append("-o /dev/null")
+            append("-o /dev/null")
         
         if config.error_file:
-            parts.append(f"-e {config.error_file}")
+            append(f"-e {config.error_file}")
         
         # Email notifications
         if config.email_on_start:
-            parts.append("-B")
+            append("-B")
         
         # X11 forwarding
         if config.x11_forwarding:
-            parts.append("-XF")
+            append("-XF")
         
         # Working directory
         if config.working_directory:
-            parts.append(f'-cwd "{config.working_directory}"')
+            append(f'-cwd "{config.working_directory}"')
         
         # Parallel environment (MPI)
         if config.parallel_environment:
-            parts.append(f"-app {config.parallel_environment}")
+            append(f"-app {config.parallel_environment}")
         
         # Architecture requirements
         if config.architecture_requirements:
-            for arch in config.architecture_requirements:
-                parts.append(f'-R"select[{arch}]"')
+            parts.extend(f'-R"select[{arch}]"' for arch in config.architecture_requirements)
         
         # License requirements
         if config.license_requirements:
-            for license_type, count in config.license_requirements.items():
-                parts.append(f'-R"rusage[{license_type}={count}]"')
+            parts.extend(
+                f'-R"rusage[{license_type}={count}]"'
+                for license_type, count in config.license_requirements.items()
+            )
         
         # Custom resource requirements
-        for resource in config.custom_resources:
-            parts.append(f'-R"{resource}"')
+        parts.extend(f'-R"{resource}"' for resource in config.custom_resources)
         
         # Environment variables
-        for var, value in config.environment_vars.items():
-            parts.append(f'-env "{var}={value}"')
+        parts.extend(f'-env "{var}={value}"' for var, value in config.environment_vars.items())
         
         # Command to execute
         if config.command:
             if config.job_type == JobType.INTERACTIVE:
                 # For interactive jobs, the command is usually a shell
-                parts.append(config.command)
+                append(config.command)
             else:
                 # For batch jobs, quote the command
-                parts.append(f"'{config.command}'")
+                append(f"'{config.command}'")
         
         return " ".join(parts)
     
@@ -131,7 +135,7 @@ class BsubCommandBuilder:
         
         # Runtime validation
         if config.runtime_limit:
-            if not self._is_valid_time_format(config.runtime_limit):
+            if not _is_valid_time_format(config.runtime_limit):
                 warnings.append("Runtime limit must be in format MM or HH:MM")
         
         # Queue validation
@@ -155,24 +159,6 @@ class BsubCommandBuilder:
         
         return warnings
     
-    def _is_valid_time_format(self, time_str: str) -> bool:
-        """Check if time string is in valid MM or HH:MM format"""
-        if ':' in time_str:
-            parts = time_str.split(':')
-            if len(parts) != 2:
-                return False
-            try:
-                hours, minutes = int(parts[0]), int(parts[1])
-                return 0 <= hours <= 999 and 0 <= minutes <= 59
-            except ValueError:
-                return False
-        else:
-            try:
-                minutes = int(time_str)
-                return 0 <= minutes <= 59999
-            except ValueError:
-                return False
-    
     def estimate_cost(self, config: JobConfiguration) -> float:
         """Calculate estimated cost for the job"""
         if not config.runtime_limit:
@@ -180,24 +166,18 @@ class BsubCommandBuilder:
         
         # Parse runtime to hours
         try:
-            if ':' in config.runtime_limit:
-                hours, minutes = map(int, config.runtime_limit.split(':'))
-                runtime_hours = hours + minutes / 60
-            else:
-                runtime_hours = int(config.runtime_limit) / 60
+            runtime_hours = _parse_runtime_hours(config.runtime_limit)
         except ValueError:
             return 0.0
         
         # CPU cost
-        cpu_cost_per_slot_hour = self.cluster_config.get('cpu_cost_per_slot_hour', 0.05)
-        cpu_cost = config.slots * runtime_hours * cpu_cost_per_slot_hour
+        cpu_cost = config.slots * runtime_hours * self._cpu_cost_per_slot_hour
         
         # GPU cost
         gpu_cost = 0.0
         if config.job_type == JobType.GPU and config.gpu_config:
-            gpu_costs = self.cluster_config.get('gpu_costs', {})
             gpu_type = config.gpu_config.gpu_type or 'default'
-            gpu_cost_per_hour = gpu_costs.get(gpu_type, 0.20)
+            gpu_cost_per_hour = self._gpu_costs.get(gpu_type, 0.20)
             gpu_cost = config.gpu_config.num_gpus * runtime_hours * gpu_cost_per_hour
         
         # Array job multiplier
@@ -16,6 +16,9 @@ class JobValidator:
     TIME_PATTERN_HHMM = re.compile(r'^([0-9]{1,3}):([0-5][0-9])$')
     TIME_PATTERN_MM = re.compile(r'^([0-9]{1,5})$')
     
+    # Characters that aren't allowed in file paths
+    INVALID_PATH_CHARS = re.compile(r'[<>|*?]')
+    
     @classmethod
     def validate_job_name(cls, job_name: str) -> Tuple[bool, Optional[str]]:
         """Validate job name according to cluster policies"""
@@ -101,7 +104,7 @@ class JobValidator:
                 return False, "File path should be absolute (start with /)"
             
             # Check for invalid characters (basic check)
-            if any(char in file_path for char in ['<', '>', '|', '*', '?']):
+            if cls.INVALID_PATH_CHARS.search(file_path):
                 return False, "File path contains invalid characters"
             
             return True, None
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Single entry point for the BSub Wizard development scripts
+
+Runs the wizard, the diagnostic tool, and the test scripts from one Python
+process instead of starting a fresh interpreter for each of them.
+
+Usage:
+    python wizard_cli.py start           # Start the wizard
+    python wizard_cli.py diagnose        # Run the diagnostic tool
+    python wizard_cli.py test-basic      # Run the basic component tests
+    python wizard_cli.py --help          # List all subcommands
+"""
+
+import importlib
+import sys
+
+# Subcommand -> (module, function returning an exit code, help text)
+COMMANDS = {
+    "diagnose": ("wizard.diagnostics", "run_diagnose", "Run the diagnostic tool"),
+    "test-basic": ("test_basic", "main", "Run the basic component tests"),
+    "test-structure": ("wizard.diagnostics", "run_app_structure", "Check the application structure"),
+    "test-quick": ("wizard.diagnostics", "run_quick_run", "Quick check that the app starts"),
+    "test-enter": ("wizard.diagnostics", "run_enter_key", "Check Enter key navigation"),
+    "test-nav": ("wizard.diagnostics", "run_navigation", "Check wizard navigation"),
+    "test-simple": ("wizard.diagnostics", "run_simple", "Check the app imports and constructs"),
+}
+
+
+def _run(module_name: str, function_name: str) -> int:
+    """Import a module and run one of its entry functions"""
+    result = getattr(importlib.import_module(module_name), function_name)()
+    return result or 0
+
+
+def main() -> int:
+    """Dispatch to the requested subcommand"""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="BSub Wizard - development entry point",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("start", help="Start the interactive wizard")
+    for name, (_, _, help_text) in COMMANDS.items():
+        subparsers.add_parser(name, help=help_text)
+
+    args = parser.parse_args()
+
+    if args.command == "start":
+        from wizard.__main__ import run_wizard
+        run_wizard()
+        return 0
+
+    module_name, function_name, _ = COMMANDS[args.command]
+    return _run(module_name, function_name)
+
+
+if __name__ == "__main__":
+    sys.exit(main())